@@ -1,4 +1,3 @@
-import ast
 import re
 import subprocess
 import sys
@@ -17,6 +16,11 @@ RHEL = "rhel"
 ARCH = "arch"
 SUSE = "suse"
 
+# A KEY=value line in a FreeDesktop os-release file.
+_KV_RE = re.compile(r"([A-Z][A-Z_0-9]+)=(.*)")
+# A backslash escape in a quoted os-release value.
+_UNESCAPE_RE = re.compile(r"\\([\\\$\"'`])")
+
 
 def parse_freedesktop_os_release(content):
     """Parse the content of an /etc/os-release file.
@@ -29,21 +33,21 @@ def parse_freedesktop_os_release(content):
         `platform.freedesktop_os_release()`.
     """
     values = {}
-    for line_number, line in enumerate(content.split("\n"), start=1):
+    for line_number, line in enumerate(content.splitlines(), start=1):
         line = line.rstrip()
         if not line or line.startswith("#"):
             continue
-        m = re.match(r"([A-Z][A-Z_0-9]+)=(.*)", line)
+        m = _KV_RE.match(line)
         if m:
             name, val = m.groups()
             if val and val[0] in "\"'":
-                try:
-                    val = ast.literal_eval(val)
-                except SyntaxError as e:
+                # Strip the quotes, and process any escaped characters.
+                if len(val) < 2 or val[-1] != val[0]:
                     raise ParseError(
                         "Failed to parse output of FreeDesktop os-release file; "
-                        f"Line {line_number}: {e}"
+                        f"Line {line_number}: Unterminated quoted value {line!r}"
                     )
+                val = _UNESCAPE_RE.sub(r"\1", val[1:-1])
             values[name] = val
         else:
             raise ParseError(
@@ -157,7 +161,7 @@ class LocalRequirementsMixin:  # pragma: no-cover-if-is-windows
         # Iterate over every requirement, looking for local references
         for requirement in requires:
             if _is_local_requirement(requirement):
-                if Path(requirement).is_dir():
+                if self.tools.os.path.isdir(requirement):
                     # Requirement is a filesystem reference
                     # Build an sdist for the local requirement
                     with self.input.wait_bar(f"Building sdist for {requirement}..."):
@@ -215,7 +219,10 @@ class LocalRequirementsMixin:  # pragma: no-cover-if-is-windows
 
         # Add in any local packages.
         # The sort is needed to ensure testing consistency
-        for filename in sorted(self.local_requirements_path(app).iterdir()):
+        for filename in sorted(
+            self.local_requirements_path(app).iterdir(),
+            key=lambda path: path.name,
+        ):
             final.append(filename)
 
         return final
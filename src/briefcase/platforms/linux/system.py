@@ -29,6 +29,13 @@ from briefcase.platforms.linux import (
     parse_freedesktop_os_release,
 )
 
+# The command used by each packaging system to report the ABI it is targeting.
+_BUILD_ENV_ABI_COMMAND = {
+    "deb": ("dpkg", "--print-architecture"),
+    "rpm": ("rpm", "--eval", "%_target_cpu"),
+    "pkg": ("pacman-conf", "Architecture"),
+}
+
 
 class LinuxSystemPassiveMixin(LinuxMixin):
     # The Passive mixin honors the Docker options, but doesn't try to verify
@@ -102,21 +109,30 @@ class LinuxSystemPassiveMixin(LinuxMixin):
         return self.python_version_tag
 
     def platform_freedesktop_info(self, app):
+        # The host's /etc/os-release won't change while Briefcase is running, so
+        # only read and parse it once.
         try:
-            if sys.version_info < (3, 10):  # pragma: no-cover-if-gte-py310
-                # This reproduces the Python 3.10 platform.freedesktop_os_release() function.
-                with self.tools.ETC_OS_RELEASE.open(encoding="utf-8") as f:
-                    freedesktop_info = parse_freedesktop_os_release(f.read())
-            else:  # pragma: no-cover-if-lt-py310
-                freedesktop_info = self.tools.platform.freedesktop_os_release()
-
-        except OSError as e:
-            raise BriefcaseCommandError(
-                "Could not find the /etc/os-release file. "
-                "Is this a FreeDesktop-compliant Linux distribution?"
-            ) from e
+            return self._host_freedesktop_info
+        except AttributeError:
+            try:
+                if sys.version_info < (3, 10):  # pragma: no-cover-if-gte-py310
+                    # This reproduces the Python 3.10 platform.freedesktop_os_release() function.
+                    with self.tools.ETC_OS_RELEASE.open(encoding="utf-8") as f:
+                        self._host_freedesktop_info = parse_freedesktop_os_release(
+                            f.read()
+                        )
+                else:  # pragma: no-cover-if-lt-py310
+                    self._host_freedesktop_info = (
+                        self.tools.platform.freedesktop_os_release()
+                    )
 
-        return freedesktop_info
+            except OSError as e:
+                raise BriefcaseCommandError(
+                    "Could not find the /etc/os-release file. "
+                    "Is this a FreeDesktop-compliant Linux distribution?"
+                ) from e
+
+            return self._host_freedesktop_info
 
     def finalize_app_config(self, app: AppConfig):
         """Finalize app configuration.
@@ -229,11 +245,7 @@ class LinuxSystemMostlyPassiveMixin(LinuxSystemPassiveMixin):
         Each packaging system uses different values to identify the exact ABI that
         describes the target environment...so just defer to the packaging system.
         """
-        command = {
-            "deb": ["dpkg", "--print-architecture"],
-            "rpm": ["rpm", "--eval", "%_target_cpu"],
-            "pkg": ["pacman-conf", "Architecture"],
-        }[app.packaging_format]
+        command = list(_BUILD_ENV_ABI_COMMAND[app.packaging_format])
         try:
             return (
                 self.tools[app].app_context.check_output(command).split("\n")[0].strip()
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from briefcase.config import AppConfig
 from briefcase.console import Console, Log
 from briefcase.exceptions import BriefcaseCommandError
 from briefcase.platforms.linux import parse_freedesktop_os_release
@@ -76,6 +77,59 @@ def test_nodocker(create_command, first_app_config, tmp_path):
     # test_properties
 
 
+def test_nodocker_freedesktop_info_cached(create_command, first_app_config, tmp_path):
+    """The host's os-release file is only read once when finalizing multiple apps."""
+    second_app_config = AppConfig(
+        app_name="second",
+        bundle="com.example",
+        version="0.0.2",
+        description="The second simple app",
+        sources=["src/second"],
+        license={"file": "LICENSE"},
+    )
+
+    # Build the app without docker
+    create_command.target_image = None
+    create_command.target_glibc_version = MagicMock(return_value="2.42")
+
+    os_release = "\n".join(
+        [
+            "ID=somevendor",
+            "VERSION_CODENAME=surprising",
+            "ID_LIKE=debian",
+        ]
+    )
+    if sys.version_info >= (3, 10):
+        # mock platform.freedesktop_os_release()
+        create_command.tools.platform.freedesktop_os_release = MagicMock(
+            return_value=parse_freedesktop_os_release(os_release)
+        )
+    else:
+        # For Pre Python3.10, mock the /etc/release file
+        create_file(tmp_path / "os-release", os_release)
+        create_command.tools.ETC_OS_RELEASE = tmp_path / "os-release"
+
+    # Finalize both app configs
+    create_command.finalize_app_config(first_app_config)
+
+    if sys.version_info < (3, 10):
+        # Remove the os-release file; the cached content should be used.
+        (tmp_path / "os-release").unlink()
+
+    create_command.finalize_app_config(second_app_config)
+
+    # Both apps have been finalized with the same host details
+    for app in [first_app_config, second_app_config]:
+        assert app.target_image == "somevendor:surprising"
+        assert app.target_vendor == "somevendor"
+        assert app.target_codename == "surprising"
+        assert app.target_vendor_base == "debian"
+
+    if sys.version_info >= (3, 10):
+        # The host's release information was only retrieved once
+        create_command.tools.platform.freedesktop_os_release.assert_called_once_with()
+
+
 def test_nodocker_non_freedesktop(create_command, first_app_config, tmp_path):
     """If the system isn't FreeDesktop compliant raise an error."""
     # Build the app without docker
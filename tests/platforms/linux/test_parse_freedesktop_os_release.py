@@ -13,12 +13,27 @@ KEY3='another quoted value'
 
 # Commented line
 KEY4=42
+KEY5="escaped \\"quote\\", \\$dollar, \\`backtick\\` and \\\\backslash"
+KEY6='escaped \\'quote\\''
+KEY7=""
 """
     assert parse_freedesktop_os_release(content) == {
         "KEY1": "value",
         "KEY2": "quoted value",
         "KEY3": "another quoted value",
         "KEY4": "42",
+        "KEY5": 'escaped "quote", $dollar, `backtick` and \\backslash',
+        "KEY6": "escaped 'quote'",
+        "KEY7": "",
+    }
+
+
+def test_parse_line_endings():
+    "Content with Windows line endings and trailing whitespace can be parsed."
+    content = "KEY1=value  \r\nKEY2='quoted value'\r\n   \r\n# Commented line\r\n"
+    assert parse_freedesktop_os_release(content) == {
+        "KEY1": "value",
+        "KEY2": "quoted value",
     }
 
 
@@ -26,7 +41,11 @@ KEY4=42
     "content, error",
     [
         ("KEY=value\nnot valid content", r"Line 2: 'not valid content'"),
-        ("KEY=value\nBAD='unbalanced quote", r"string literal"),
+        (
+            "KEY=value\nBAD='unbalanced quote",
+            r"Line 2: Unterminated quoted value \"BAD='unbalanced quote\"",
+        ),
+        ('KEY=value\nBAD="', r"Line 2: Unterminated quoted value 'BAD=\"'"),
     ],
 )
 def test_parse_error(content, error):